@@ -7,247 +7,725 @@ A comprehensive validator for APAI specifications.
 
 import yaml
 import json
+import hashlib
+import mmap
+import os
 import sys
-from typing import Dict, List, Any, Optional
-from pathlib import Path
-import argparse
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, Final, List, Any, Optional
+
+# Use the libyaml C loader when PyYAML was built with it; it parses the same
+# safe subset of YAML several times faster than the pure-Python loader.
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+try:
+    from yaml import CSafeDumper as _SafeDumper
+except ImportError:
+    from yaml import SafeDumper as _SafeDumper
+
+# Optional: fastjsonschema compiles the bundled JSON Schema into specialized
+# Python code, replacing the per-field checks below with a single fast call.
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
+# Optional: orjson decodes JSON in C, several times faster than the stdlib
+# codec. Its JSONDecodeError subclasses json.JSONDecodeError, so the error
+# handling below works for both.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional: ijson streams large JSON documents one top-level section at a
+# time, bounding peak memory by the largest section instead of the file.
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# .json files above this size are routed through the streaming path when
+# ijson is available.
+_STREAMING_THRESHOLD: Final = 16 << 20
+
+# Files above this size are read through mmap instead of the buffered
+# reader, skipping its chunk-and-reassemble loop.
+_MMAP_THRESHOLD: Final = 8 << 20
+
+
+def _read_file_bytes(path: str) -> bytes:
+    """Read a file's contents in a single call.
+
+    Both parsers accept bytes directly, so no decode pass is needed; very
+    large files are pulled in through one mmap copy rather than the
+    buffered reader.
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size > _MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return mm[:]
+        return f.read()
+
+# On-disk cache of validation results, keyed on file content. Lets CI
+# pipelines revalidate unchanged specs without parsing them again.
+_CACHE_DIR: Final = os.path.join(
+    os.environ.get('XDG_CACHE_HOME', os.path.join(os.path.expanduser('~'), '.cache')), 'apai')
+
+# Part of every result-cache key. Bump whenever validation behaviour
+# changes, so an upgraded validator never serves verdicts cached by
+# older code.
+_CACHE_VERSION: Final = 2
+
+
+# Required sections and valid enumeration values, hoisted to module scope so
+# the per-item validation loops do O(1) frozenset lookups instead of
+# rebuilding list literals on every iteration. Declared Final so AOT
+# compilers (mypyc/Cython) can specialize the lookups.
+_REQUIRED_SECTIONS: Final = frozenset({'apai', 'info', 'models', 'prompts', 'constraints', 'tasks', 'context', 'evaluation'})
+_VALID_MODEL_TYPES: Final = frozenset({'LLM', 'Vision', 'Audio', 'Multimodal', 'Classification', 'Embedding'})
+_VALID_PROMPT_ROLES: Final = frozenset({'system', 'user', 'assistant'})
+_VALID_SEVERITIES: Final = frozenset({'low', 'medium', 'high', 'critical'})
+_VALID_COMPLEXITIES: Final = frozenset({'low', 'medium', 'high'})
+_VALID_STEP_ACTIONS: Final = frozenset({'analyze', 'generate', 'validate', 'search', 'escalate', 'classify', 'mcp_tool', 'mcp_resource'})
+_MCP_STEP_ACTIONS: Final = frozenset({'mcp_tool', 'mcp_resource'})
+_VALID_TRANSPORT_TYPES: Final = frozenset({'stdio', 'sse', 'websocket'})
+_VALID_AUTH_TYPES: Final = frozenset({'none', 'api_key', 'oauth', 'custom'})
+
+# Required fields per item kind, as frozensets so missing-field detection is
+# a single C-level set difference instead of a per-field Python loop.
+_REQUIRED_INFO_FIELDS: Final = frozenset({'title', 'version', 'description'})
+_REQUIRED_MODEL_FIELDS: Final = frozenset({'id', 'type', 'provider', 'name', 'purpose'})
+_REQUIRED_PROMPT_FIELDS: Final = frozenset({'id', 'role', 'template'})
+_REQUIRED_CONSTRAINT_FIELDS: Final = frozenset({'id', 'rule', 'severity'})
+_REQUIRED_TASK_FIELDS: Final = frozenset({'id', 'description'})
+_REQUIRED_STEP_FIELDS: Final = frozenset({'name', 'action'})
+_REQUIRED_MCP_SERVER_FIELDS: Final = frozenset({'id', 'name', 'description', 'version', 'transport', 'capabilities', 'authentication'})
+
+# Recognized YAML file suffixes (lowercased before lookup).
+_YAML_SUFFIXES: Final = frozenset({'yaml', 'yml'})
+
+
+def _build_structural_schema() -> Dict[str, Any]:
+    """Build the JSON Schema compiled by the fastjsonschema fast path.
+
+    Generated from the same required-field and enum tables the
+    hand-written validators use, and expressing exactly their
+    error-producing checks — no more (the canonical spec schema is much
+    stricter) and no less — so a spec's verdict is the same whether or
+    not fastjsonschema is installed. Enum violations that the
+    hand-written path only warns about (model type, step action) are
+    deliberately absent. Subschemas for optional nested objects carry no
+    "type", because "required" and "properties" only constrain objects:
+    that mirrors the hand-written isinstance guards, which skip non-dict
+    values (the enclosing item's required-field check flags them).
+    """
+    def _require_when(field: str, values: List[str], then: List[str]) -> Dict[str, Any]:
+        return {
+            'if': {'required': [field], 'properties': {field: {'enum': values}}},
+            'then': {'required': then},
+        }
+
+    return {
+        '$schema': 'http://json-schema.org/draft-07/schema#',
+        'type': 'object',
+        'properties': {
+            'apai': {'type': 'string'},
+            'info': {
+                'type': 'object',
+                'required': sorted(_REQUIRED_INFO_FIELDS),
+                'properties': {
+                    'ai_metadata': {
+                        'properties': {'complexity': {'enum': sorted(_VALID_COMPLEXITIES)}},
+                    },
+                },
+            },
+            'models': {
+                'type': 'array',
+                'minItems': 1,
+                'items': {'type': 'object', 'required': sorted(_REQUIRED_MODEL_FIELDS)},
+            },
+            'prompts': {
+                'type': 'array',
+                'items': {
+                    'type': 'object',
+                    'required': sorted(_REQUIRED_PROMPT_FIELDS),
+                    'properties': {'role': {'enum': sorted(_VALID_PROMPT_ROLES)}},
+                },
+            },
+            'constraints': {
+                'type': 'array',
+                'items': {
+                    'type': 'object',
+                    'required': sorted(_REQUIRED_CONSTRAINT_FIELDS),
+                    'properties': {'severity': {'enum': sorted(_VALID_SEVERITIES)}},
+                },
+            },
+            'tasks': {
+                'type': 'array',
+                'items': {
+                    'type': 'object',
+                    'required': sorted(_REQUIRED_TASK_FIELDS),
+                    'properties': {
+                        'steps': {
+                            'items': {
+                                'type': 'object',
+                                'required': sorted(_REQUIRED_STEP_FIELDS),
+                                'allOf': [
+                                    _require_when('action', ['mcp_tool'], ['mcp_server', 'mcp_tool']),
+                                    _require_when('action', ['mcp_resource'], ['mcp_server', 'mcp_resource']),
+                                ],
+                            },
+                        },
+                    },
+                },
+            },
+            'context': {
+                'type': 'object',
+                'properties': {
+                    'mcp_servers': {
+                        'type': 'array',
+                        'items': {
+                            'type': 'object',
+                            'required': sorted(_REQUIRED_MCP_SERVER_FIELDS),
+                            'properties': {
+                                'transport': {
+                                    'required': ['type'],
+                                    'properties': {'type': {'enum': sorted(_VALID_TRANSPORT_TYPES)}},
+                                    'allOf': [
+                                        _require_when('type', ['stdio'], ['command']),
+                                        _require_when('type', ['sse', 'websocket'], ['url']),
+                                    ],
+                                },
+                                'authentication': {
+                                    'required': ['type'],
+                                    'properties': {'type': {'enum': sorted(_VALID_AUTH_TYPES)}},
+                                },
+                            },
+                        },
+                    },
+                },
+            },
+            'evaluation': {'type': 'object'},
+        },
+    }
+
+
+class _AbortValidation(Exception):
+    """Raised by _error to unwind a fail-fast validation run.
+
+    Internal control flow only; the public validate_* entry points catch
+    it and return False with the single recorded error in place.
+    """
 
 
 class APAIValidator:
     """Main validator class for APAI specifications."""
-    
-    def __init__(self):
+
+    # No per-instance __dict__: batch validation creates one instance per
+    # file, and slots keep them small with C-level attribute access.
+    # Subclasses adding attributes must declare their own __slots__.
+    __slots__ = ('errors', 'warnings', 'schema_version', 'fail_fast',
+                 'inherited_specs', 'merge_cache', '_spec_cache')
+
+    # Compiled JSON Schema validator, shared by all instances. None until
+    # the first use, False when compilation is not possible (no
+    # fastjsonschema). The digest of the compiled schema feeds the result
+    # cache key.
+    _compiled_schema = None
+    _compiled_schema_digest = ''
+
+    # Section-name -> validator table driving validate_spec. Method names
+    # rather than bound methods, so the table is shared by all instances
+    # and resolved with one getattr per section present.
+    _SECTION_VALIDATORS = (
+        ('apai', '_validate_apai_version'),
+        ('info', '_validate_info'),
+        ('models', '_validate_models'),
+        ('prompts', '_validate_prompts'),
+        ('constraints', '_validate_constraints'),
+        ('tasks', '_validate_tasks'),
+        ('context', '_validate_context'),
+        ('evaluation', '_validate_evaluation'),
+    )
+
+    def __init__(self, fail_fast: bool = False):
         self.errors = []
         self.warnings = []
         self.schema_version = "0.1.0"
+
+        # When set, validation stops at the first error instead of visiting
+        # every item; get_errors() then returns exactly one entry.
+        self.fail_fast = fail_fast
         
         # Hierarchical composition properties
         self.inherited_specs = {}
         self.merge_cache = {}
+        self._spec_cache = {}
     
     def validate_file(self, file_path: str) -> bool:
-        """Validate an APAI specification file."""
+        """Validate an APAI specification file.
+
+        Results are cached under ~/.cache/apai, keyed on a digest of the
+        file contents and the validator schema version, so repeated runs
+        over unchanged specs skip parsing and validation entirely.
+        """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                if file_path.endswith('.yaml') or file_path.endswith('.yml'):
-                    spec = yaml.safe_load(f)
-                elif file_path.endswith('.json'):
-                    spec = json.load(f)
-                else:
-                    self.errors.append(f"Unsupported file format: {file_path}")
-                    return False
-            
-            return self.validate_spec(spec)
-        
+            # Stream very large JSON specs instead of materializing them.
+            if (ijson is not None and file_path.rsplit('.', 1)[-1].lower() == 'json'
+                    and os.path.getsize(file_path) > _STREAMING_THRESHOLD):
+                return self.validate_file_streaming(file_path)
+        except OSError:
+            pass  # fall through to the normal path and its error reporting
+
+        try:
+            # Binary mode: both parsers detect the encoding themselves, and
+            # the libyaml loader scans the raw bytes without a prior
+            # Python-level decode pass.
+            data = _read_file_bytes(file_path)
+
+            suffix = file_path.rsplit('.', 1)[-1].lower()
+            if suffix in _YAML_SUFFIXES:
+                is_yaml = True
+            elif suffix == 'json':
+                is_yaml = False
+            else:
+                self._error("Unsupported file format: %s", file_path)
+                return False
+
+            # A fail-fast run records a truncated error list, so it neither
+            # reads nor writes the on-disk result cache.
+            if not self.fail_fast:
+                cache_key = self._cache_key(data, is_yaml)
+                if self._load_cached_result(cache_key):
+                    return len(self.errors) == 0
+
+            if is_yaml:
+                spec = yaml.load(data, Loader=_SafeLoader)
+            else:
+                spec = orjson.loads(data) if orjson is not None else json.loads(data)
+
+            is_valid = self.validate_spec(spec)
+
+        except _AbortValidation:
+            return False
+        # The handlers below append directly: a _error call here would
+        # re-raise _AbortValidation out of the handler under fail_fast.
         except FileNotFoundError:
-            self.errors.append(f"File not found: {file_path}")
+            self.errors.append(("File not found: %s", (file_path,)))
             return False
+        # Parsers were fed bytes, so their error marks say "<byte string>";
+        # name the file ourselves to keep multi-file output attributable.
         except yaml.YAMLError as e:
-            self.errors.append(f"YAML parsing error: {e}")
+            self.errors.append(("YAML parsing error in %s: %s", (file_path, e)))
             return False
         except json.JSONDecodeError as e:
-            self.errors.append(f"JSON parsing error: {e}")
+            self.errors.append(("JSON parsing error in %s: %s", (file_path, e)))
             return False
         except Exception as e:
-            self.errors.append(f"Unexpected error: {e}")
+            self.errors.append(("Unexpected error: %s", (e,)))
+            return False
+
+        if not self.fail_fast:
+            self._store_cached_result(cache_key)
+        return is_valid
+
+    def _cache_key(self, data: bytes, is_yaml: bool) -> str:
+        """Cache key for a spec's content.
+
+        schema_version and _CACHE_VERSION invalidate old entries when the
+        spec or the validator code changes. The engine marker keeps
+        compiled-schema and fallback results apart (their recorded
+        messages differ) and carries a digest of the schema actually
+        compiled, so a changed schema never serves stale entries even
+        without a _CACHE_VERSION bump.
+        """
+        digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+        if self._get_compiled_schema() is not None:
+            engine = f"fj{type(self)._compiled_schema_digest}"
+        else:
+            engine = 'py'
+        return (f"{self.schema_version}-v{_CACHE_VERSION}-{engine}-"
+                f"{'yaml' if is_yaml else 'json'}-{digest}")
+
+    def _load_cached_result(self, cache_key: str) -> bool:
+        """Load a cached result into errors/warnings; True on a cache hit.
+
+        A corrupt or wrong-shaped entry is treated as a miss so the file
+        is simply revalidated (and the entry rewritten), never reported
+        as a validation failure.
+        """
+        try:
+            with open(os.path.join(_CACHE_DIR, cache_key + '.json'), 'rb') as f:
+                cached = json.load(f)
+            errors = [(message, ()) for message in cached['errors']]
+            warnings = [(message, ()) for message in cached['warnings']]
+        except (OSError, ValueError, KeyError, TypeError):
             return False
+
+        self.errors = errors
+        self.warnings = warnings
+        return True
+
+    def _store_cached_result(self, cache_key: str) -> None:
+        """Persist the current result; caching is best-effort."""
+        try:
+            os.makedirs(_CACHE_DIR, exist_ok=True)
+            target = os.path.join(_CACHE_DIR, cache_key + '.json')
+            tmp_path = f"{target}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'errors': self.get_errors(), 'warnings': self.get_warnings()}, f)
+            os.replace(tmp_path, target)
+        except OSError:
+            pass
     
+    def validate_file_streaming(self, file_path: str) -> bool:
+        """Validate a .json spec without materializing the whole document.
+
+        Top-level sections are streamed one at a time via ijson, so peak
+        memory is bounded by the largest single section rather than the
+        whole file. Reference ids and task step references are collected
+        while each section streams past and cross-checked at the end.
+        Falls back to validate_file when ijson is unavailable or the file
+        is not JSON; results are not cached.
+
+        This path always uses the hand-written section validators, never
+        the compiled schema — the whole document is deliberately not
+        materialized. The schema is generated from the same tables those
+        validators read (see _build_structural_schema), so the verdict
+        matches validate_file regardless of file size or installed
+        extras; the streaming parity tests pin this down.
+        """
+        if ijson is None or file_path.rsplit('.', 1)[-1].lower() != 'json':
+            return self.validate_file(file_path)
+
+        self.errors = []
+        self.warnings = []
+
+        validators = {name: getattr(self, method)
+                      for name, method in self._SECTION_VALIDATORS}
+        seen_sections = set()
+        model_ids = prompt_ids = mcp_server_ids = None
+        step_refs = []
+
+        try:
+            with open(file_path, 'rb') as f:
+                for section, value in ijson.kvitems(f, ''):
+                    seen_sections.add(section)
+
+                    validator = validators.get(section)
+                    if validator is not None:
+                        validator(value)
+
+                    # Collect what the final cross-check needs, then let the
+                    # section be garbage collected.
+                    if section == 'models' and isinstance(value, list):
+                        model_ids = {m.get('id') for m in value if type(m) is dict} - {None}
+                    elif section == 'prompts' and isinstance(value, list):
+                        prompt_ids = {p.get('id') for p in value if type(p) is dict} - {None}
+                    elif section == 'context' and isinstance(value, dict):
+                        servers = value.get('mcp_servers')
+                        if isinstance(servers, list):
+                            mcp_server_ids = {s.get('id') for s in servers if type(s) is dict} - {None}
+                    elif section == 'tasks' and isinstance(value, list):
+                        for task in value:
+                            if type(task) is not dict:
+                                continue
+                            for step in task.get('steps', ()):
+                                if type(step) is dict:
+                                    refs = (step.get('model'), step.get('prompt'), step.get('mcp_server'))
+                                    if refs != (None, None, None):
+                                        step_refs.append(refs)
+
+        except _AbortValidation:
+            return False
+        except FileNotFoundError:
+            self.errors.append(("File not found: %s", (file_path,)))
+            return False
+        except Exception as e:
+            self.errors.append(("JSON parsing error: %s", (e,)))
+            return False
+
+        try:
+            for section in sorted(_REQUIRED_SECTIONS - seen_sections):
+                self._error("Missing required section: %s", section)
+
+            # Same semantics as _cross_validate: only an absent section
+            # disables its reference check; an empty one still flags every
+            # dangling reference.
+            error = self._error
+            for model, prompt, mcp_server in step_refs:
+                if model is not None and model_ids is not None and model not in model_ids:
+                    error("Task references unknown model: %s", model)
+                if prompt is not None and prompt_ids is not None and prompt not in prompt_ids:
+                    error("Task references unknown prompt: %s", prompt)
+                if mcp_server is not None and mcp_server_ids is not None and mcp_server not in mcp_server_ids:
+                    error("Task references unknown MCP server: %s", mcp_server)
+        except _AbortValidation:
+            pass  # fail_fast: the first error ends the run
+
+        return len(self.errors) == 0
+
+    @classmethod
+    def _get_compiled_schema(cls):
+        """Compile the structural schema once per process.
+
+        Returns the compiled validator callable, or None when
+        fastjsonschema is not installed (or compilation fails).
+        """
+        if cls._compiled_schema is None:
+            if fastjsonschema is None:
+                cls._compiled_schema = False
+            else:
+                try:
+                    schema = _build_structural_schema()
+                    cls._compiled_schema = fastjsonschema.compile(schema)
+                    cls._compiled_schema_digest = hashlib.blake2b(
+                        json.dumps(schema, sort_keys=True).encode(),
+                        digest_size=8).hexdigest()
+                except Exception:
+                    cls._compiled_schema = False
+        return cls._compiled_schema or None
+
     def validate_spec(self, spec: Dict[str, Any]) -> bool:
-        """Validate an APAI specification dictionary."""
+        """Validate an APAI specification dictionary.
+
+        When fastjsonschema is installed, per-field structural validation
+        is delegated to a validator compiled once from a schema generated
+        off the same tables the hand-written checks use (see
+        _build_structural_schema), so the verdict is the same either way;
+        only the error wording and the advisory warnings differ, since
+        fastjsonschema stops at the first violation and has no warning
+        concept. Checks no schema can express — required sections, id
+        uniqueness, cross-references — always run on both paths.
+        """
         self.errors = []
         self.warnings = []
-        
-        # Validate required sections
-        self._validate_required_sections(spec)
-        
-        # Validate each section
-        if 'apai' in spec:
-            self._validate_apai_version(spec["apai"])
-        
-        if 'info' in spec:
-            self._validate_info(spec['info'])
-        
-        if 'models' in spec:
-            self._validate_models(spec['models'])
-        
-        if 'prompts' in spec:
-            self._validate_prompts(spec['prompts'])
-        
-        if 'constraints' in spec:
-            self._validate_constraints(spec['constraints'])
-        
-        if 'tasks' in spec:
-            self._validate_tasks(spec['tasks'])
-        
-        if 'context' in spec:
-            self._validate_context(spec['context'])
-        
-        if 'evaluation' in spec:
-            self._validate_evaluation(spec['evaluation'])
-        
-        # Cross-validation
-        self._cross_validate(spec)
-        
+
+        try:
+            compiled = self._get_compiled_schema()
+            if compiled is not None:
+                try:
+                    compiled(spec)
+                except fastjsonschema.JsonSchemaValueException as e:
+                    self._error("Schema validation error: %s", e.message)
+
+                # Required sections, id uniqueness and cross-references
+                # are outside JSON Schema's reach, so those error-producing
+                # checks still run here.
+                self._validate_required_sections(spec)
+                self._check_duplicate_ids(spec)
+                self._cross_validate(spec)
+                return len(self.errors) == 0
+
+            # Validate required sections
+            self._validate_required_sections(spec)
+
+            # Validate each section present in the spec. Dispatch on key
+            # presence, not value: a present-but-null section must still
+            # reach its validator's type check.
+            for section, method_name in self._SECTION_VALIDATORS:
+                if section in spec:
+                    getattr(self, method_name)(spec[section])
+
+            # Cross-validation
+            self._cross_validate(spec)
+        except _AbortValidation:
+            pass  # fail_fast: the first error ends the run
+
         return len(self.errors) == 0
     
     def _validate_required_sections(self, spec: Dict[str, Any]) -> None:
         """Validate that all required sections are present."""
-        required_sections = [
-            'apai', 'info', 'models', 'prompts', 
-            'constraints', 'tasks', 'context', 'evaluation'
-        ]
-        
-        for section in required_sections:
-            if section not in spec:
-                self.errors.append(f"Missing required section: {section}")
+        missing = _REQUIRED_SECTIONS - spec.keys()
+        if missing:
+            for section in sorted(missing):
+                self._error("Missing required section: %s", section)
     
+    def _check_duplicate_ids(self, spec: Dict[str, Any]) -> None:
+        """Flag duplicate ids in every id-carrying section.
+
+        Companion to the compiled-schema path, where the per-section
+        validators (and their inline duplicate checks) do not run; the
+        messages match theirs exactly.
+        """
+        sections = (
+            (spec.get('models'), 'model'),
+            (spec.get('prompts'), 'prompt'),
+            (spec.get('constraints'), 'constraint'),
+            (spec.get('tasks'), 'task'),
+        )
+        context = spec.get('context')
+        if isinstance(context, dict):
+            sections += ((context.get('mcp_servers'), 'MCP server'),)
+
+        for items, label in sections:
+            if not isinstance(items, list):
+                continue
+            ids = [item['id'] for item in items if type(item) is dict and 'id' in item]
+            if len(ids) != len(set(ids)):
+                for duplicate, count in Counter(ids).items():
+                    if count > 1:
+                        self._error("Duplicate %s ID: %s", label, duplicate)
+
     def _validate_apai_version(self, version: str) -> None:
         """Validate the APAI version."""
         if not isinstance(version, str):
-            self.errors.append("apai version must be a string")
+            self._error("apai version must be a string")
             return
         
         if not version.startswith('0.1'):
-            self.warnings.append(f"Version {version} may not be supported")
+            self._warn("Version %s may not be supported", version)
     
     def _validate_info(self, info: Dict[str, Any]) -> None:
         """Validate the info section."""
-        required_fields = ['title', 'version', 'description']
-        
-        for field in required_fields:
-            if field not in info:
-                self.errors.append(f"Missing required field in info: {field}")
-        
+        if not isinstance(info, dict):
+            self._error("info must be a dictionary")
+            return
+
+        missing = _REQUIRED_INFO_FIELDS - info.keys()
+        if missing:
+            for field in sorted(missing):
+                self._error("Missing required field in info: %s", field)
+
         if 'ai_metadata' in info:
             self._validate_ai_metadata(info['ai_metadata'])
     
     def _validate_ai_metadata(self, metadata: Dict[str, Any]) -> None:
         """Validate AI-specific metadata."""
         if 'domain' not in metadata:
-            self.warnings.append("ai_metadata.domain is recommended")
+            self._warn("ai_metadata.domain is recommended")
         
         if 'complexity' in metadata:
-            valid_complexities = ['low', 'medium', 'high']
-            if metadata['complexity'] not in valid_complexities:
-                self.errors.append(f"Invalid complexity: {metadata['complexity']}")
+            if metadata['complexity'] not in _VALID_COMPLEXITIES:
+                self._error("Invalid complexity: %s", metadata['complexity'])
     
     def _validate_models(self, models: List[Dict[str, Any]]) -> None:
         """Validate the models section."""
         if not isinstance(models, list):
-            self.errors.append("models must be a list")
+            self._error("models must be a list")
             return
         
         if len(models) == 0:
-            self.errors.append("At least one model is required")
+            self._error("At least one model is required")
             return
         
-        model_ids = set()
+        # Fast path for the common all-unique case: one set build detects
+        # duplicates, and only then does a Counter pass name the culprits.
+        ids = [model['id'] for model in models if type(model) is dict and 'id' in model]
+        if len(ids) != len(set(ids)):
+            for duplicate, count in Counter(ids).items():
+                if count > 1:
+                    self._error("Duplicate model ID: %s", duplicate)
+
         for i, model in enumerate(models):
-            if not isinstance(model, dict):
-                self.errors.append(f"Model {i} must be a dictionary")
+            if type(model) is not dict:
+                self._error("Model %s must be a dictionary", i)
                 continue
             
             # Validate required fields
-            required_fields = ['id', 'type', 'provider', 'name', 'purpose']
-            for field in required_fields:
-                if field not in model:
-                    self.errors.append(f"Model {i} missing required field: {field}")
-            
-            # Check for duplicate IDs
-            if 'id' in model:
-                if model['id'] in model_ids:
-                    self.errors.append(f"Duplicate model ID: {model['id']}")
-                model_ids.add(model['id'])
+            missing = _REQUIRED_MODEL_FIELDS - model.keys()
+            if missing:
+                for field in sorted(missing):
+                    self._error("Model %s missing required field: %s", i, field)
+
             
             # Validate model type
             if 'type' in model:
-                valid_types = ['LLM', 'Vision', 'Audio', 'Multimodal', 'Classification', 'Embedding']
-                if model['type'] not in valid_types:
-                    self.warnings.append(f"Unknown model type: {model['type']}")
+                if model['type'] not in _VALID_MODEL_TYPES:
+                    self._warn("Unknown model type: %s", model['type'])
     
     def _validate_prompts(self, prompts: List[Dict[str, Any]]) -> None:
         """Validate the prompts section."""
         if not isinstance(prompts, list):
-            self.errors.append("prompts must be a list")
+            self._error("prompts must be a list")
             return
         
-        prompt_ids = set()
+        # Fast path for the common all-unique case: one set build detects
+        # duplicates, and only then does a Counter pass name the culprits.
+        ids = [prompt['id'] for prompt in prompts if type(prompt) is dict and 'id' in prompt]
+        if len(ids) != len(set(ids)):
+            for duplicate, count in Counter(ids).items():
+                if count > 1:
+                    self._error("Duplicate prompt ID: %s", duplicate)
+
         for i, prompt in enumerate(prompts):
-            if not isinstance(prompt, dict):
-                self.errors.append(f"Prompt {i} must be a dictionary")
+            if type(prompt) is not dict:
+                self._error("Prompt %s must be a dictionary", i)
                 continue
             
             # Validate required fields
-            required_fields = ['id', 'role', 'template']
-            for field in required_fields:
-                if field not in prompt:
-                    self.errors.append(f"Prompt {i} missing required field: {field}")
-            
-            # Check for duplicate IDs
-            if 'id' in prompt:
-                if prompt['id'] in prompt_ids:
-                    self.errors.append(f"Duplicate prompt ID: {prompt['id']}")
-                prompt_ids.add(prompt['id'])
+            missing = _REQUIRED_PROMPT_FIELDS - prompt.keys()
+            if missing:
+                for field in sorted(missing):
+                    self._error("Prompt %s missing required field: %s", i, field)
+
             
             # Validate role
             if 'role' in prompt:
-                valid_roles = ['system', 'user', 'assistant']
-                if prompt['role'] not in valid_roles:
-                    self.errors.append(f"Invalid prompt role: {prompt['role']}")
+                if prompt['role'] not in _VALID_PROMPT_ROLES:
+                    self._error("Invalid prompt role: %s", prompt['role'])
     
     def _validate_constraints(self, constraints: List[Dict[str, Any]]) -> None:
         """Validate the constraints section."""
         if not isinstance(constraints, list):
-            self.errors.append("constraints must be a list")
+            self._error("constraints must be a list")
             return
         
-        constraint_ids = set()
+        # Fast path for the common all-unique case: one set build detects
+        # duplicates, and only then does a Counter pass name the culprits.
+        ids = [constraint['id'] for constraint in constraints if type(constraint) is dict and 'id' in constraint]
+        if len(ids) != len(set(ids)):
+            for duplicate, count in Counter(ids).items():
+                if count > 1:
+                    self._error("Duplicate constraint ID: %s", duplicate)
+
         for i, constraint in enumerate(constraints):
-            if not isinstance(constraint, dict):
-                self.errors.append(f"Constraint {i} must be a dictionary")
+            if type(constraint) is not dict:
+                self._error("Constraint %s must be a dictionary", i)
                 continue
             
             # Validate required fields
-            required_fields = ['id', 'rule', 'severity']
-            for field in required_fields:
-                if field not in constraint:
-                    self.errors.append(f"Constraint {i} missing required field: {field}")
-            
-            # Check for duplicate IDs
-            if 'id' in constraint:
-                if constraint['id'] in constraint_ids:
-                    self.errors.append(f"Duplicate constraint ID: {constraint['id']}")
-                constraint_ids.add(constraint['id'])
+            missing = _REQUIRED_CONSTRAINT_FIELDS - constraint.keys()
+            if missing:
+                for field in sorted(missing):
+                    self._error("Constraint %s missing required field: %s", i, field)
+
             
             # Validate severity
             if 'severity' in constraint:
-                valid_severities = ['low', 'medium', 'high', 'critical']
-                if constraint['severity'] not in valid_severities:
-                    self.errors.append(f"Invalid constraint severity: {constraint['severity']}")
+                if constraint['severity'] not in _VALID_SEVERITIES:
+                    self._error("Invalid constraint severity: %s", constraint['severity'])
     
     def _validate_tasks(self, tasks: List[Dict[str, Any]]) -> None:
         """Validate the tasks section."""
         if not isinstance(tasks, list):
-            self.errors.append("tasks must be a list")
+            self._error("tasks must be a list")
             return
         
-        task_ids = set()
+        # Fast path for the common all-unique case: one set build detects
+        # duplicates, and only then does a Counter pass name the culprits.
+        ids = [task['id'] for task in tasks if type(task) is dict and 'id' in task]
+        if len(ids) != len(set(ids)):
+            for duplicate, count in Counter(ids).items():
+                if count > 1:
+                    self._error("Duplicate task ID: %s", duplicate)
+
         for i, task in enumerate(tasks):
-            if not isinstance(task, dict):
-                self.errors.append(f"Task {i} must be a dictionary")
+            if type(task) is not dict:
+                self._error("Task %s must be a dictionary", i)
                 continue
             
             # Validate required fields
-            required_fields = ['id', 'description']
-            for field in required_fields:
-                if field not in task:
-                    self.errors.append(f"Task {i} missing required field: {field}")
-            
-            # Check for duplicate IDs
-            if 'id' in task:
-                if task['id'] in task_ids:
-                    self.errors.append(f"Duplicate task ID: {task['id']}")
-                task_ids.add(task['id'])
+            missing = _REQUIRED_TASK_FIELDS - task.keys()
+            if missing:
+                for field in sorted(missing):
+                    self._error("Task %s missing required field: %s", i, field)
+
             
             # Validate task steps if present
             if 'steps' in task and isinstance(task['steps'], list):
@@ -256,41 +734,40 @@ class APAIValidator:
     def _validate_task_steps(self, steps: List[Dict[str, Any]], task_index: int) -> None:
         """Validate task steps."""
         for step_index, step in enumerate(steps):
-            if not isinstance(step, dict):
-                self.errors.append(f"Task {task_index} step {step_index} must be a dictionary")
+            if type(step) is not dict:
+                self._error("Task %s step %s must be a dictionary", task_index, step_index)
                 continue
             
             # Validate required fields
-            required_fields = ['name', 'action']
-            for field in required_fields:
-                if field not in step:
-                    self.errors.append(f"Task {task_index} step {step_index} missing required field: {field}")
+            missing = _REQUIRED_STEP_FIELDS - step.keys()
+            if missing:
+                for field in sorted(missing):
+                    self._error("Task %s step %s missing required field: %s", task_index, step_index, field)
             
             # Validate action type
             if 'action' in step:
-                valid_actions = ['analyze', 'generate', 'validate', 'search', 'escalate', 'classify', 'mcp_tool', 'mcp_resource']
-                if step['action'] not in valid_actions:
-                    self.warnings.append(f"Task {task_index} step {step_index} unknown action: {step['action']}")
+                if step['action'] not in _VALID_STEP_ACTIONS:
+                    self._warn("Task %s step %s unknown action: %s", task_index, step_index, step['action'])
             
             # Validate MCP-specific fields
-            if 'action' in step and step['action'] in ['mcp_tool', 'mcp_resource']:
+            if 'action' in step and step['action'] in _MCP_STEP_ACTIONS:
                 if 'mcp_server' not in step:
-                    self.errors.append(f"Task {task_index} step {step_index} MCP action missing mcp_server field")
+                    self._error("Task %s step %s MCP action missing mcp_server field", task_index, step_index)
                 
                 if step['action'] == 'mcp_tool' and 'mcp_tool' not in step:
-                    self.errors.append(f"Task {task_index} step {step_index} mcp_tool action missing mcp_tool field")
+                    self._error("Task %s step %s mcp_tool action missing mcp_tool field", task_index, step_index)
                 
                 if step['action'] == 'mcp_resource' and 'mcp_resource' not in step:
-                    self.errors.append(f"Task {task_index} step {step_index} mcp_resource action missing mcp_resource field")
+                    self._error("Task %s step %s mcp_resource action missing mcp_resource field", task_index, step_index)
     
     def _validate_context(self, context: Dict[str, Any]) -> None:
         """Validate the context section."""
         if not isinstance(context, dict):
-            self.errors.append("context must be a dictionary")
+            self._error("context must be a dictionary")
             return
         
         if 'memory' not in context:
-            self.warnings.append("context.memory is recommended")
+            self._warn("context.memory is recommended")
         
         # Validate MCP servers if present
         if 'mcp_servers' in context:
@@ -299,26 +776,29 @@ class APAIValidator:
     def _validate_mcp_servers(self, mcp_servers: List[Dict[str, Any]]) -> None:
         """Validate MCP servers section."""
         if not isinstance(mcp_servers, list):
-            self.errors.append("mcp_servers must be a list")
+            self._error("mcp_servers must be a list")
             return
         
-        server_ids = set()
+        # Fast path for the common all-unique case, as in the other section
+        # validators: one set build detects duplicates, a Counter pass names
+        # them.
+        ids = [server['id'] for server in mcp_servers if type(server) is dict and 'id' in server]
+        if len(ids) != len(set(ids)):
+            for duplicate, count in Counter(ids).items():
+                if count > 1:
+                    self._error("Duplicate MCP server ID: %s", duplicate)
+
         for index, server in enumerate(mcp_servers):
-            if not isinstance(server, dict):
-                self.errors.append(f"MCP server {index} must be a dictionary")
+            if type(server) is not dict:
+                self._error("MCP server %s must be a dictionary", index)
                 continue
             
             # Validate required fields
-            required_fields = ['id', 'name', 'description', 'version', 'transport', 'capabilities', 'authentication']
-            for field in required_fields:
-                if field not in server:
-                    self.errors.append(f"MCP server {index} missing required field: {field}")
-            
-            # Check for duplicate IDs
-            if 'id' in server:
-                if server['id'] in server_ids:
-                    self.errors.append(f"Duplicate MCP server ID: {server['id']}")
-                server_ids.add(server['id'])
+            missing = _REQUIRED_MCP_SERVER_FIELDS - server.keys()
+            if missing:
+                for field in sorted(missing):
+                    self._error("MCP server %s missing required field: %s", index, field)
+
             
             # Validate transport configuration
             if 'transport' in server and isinstance(server['transport'], dict):
@@ -331,97 +811,125 @@ class APAIValidator:
     def _validate_mcp_transport(self, transport: Dict[str, Any], server_index: int) -> None:
         """Validate MCP transport configuration."""
         if 'type' not in transport:
-            self.errors.append(f"MCP server {server_index} transport missing required field: type")
+            self._error("MCP server %s transport missing required field: type", server_index)
             return
         
-        valid_types = ['stdio', 'sse', 'websocket']
-        if transport['type'] not in valid_types:
-            self.errors.append(f"MCP server {server_index} invalid transport type: {transport['type']}")
+        if transport['type'] not in _VALID_TRANSPORT_TYPES:
+            self._error("MCP server %s invalid transport type: %s", server_index, transport['type'])
         
         # Validate transport-specific fields
         if transport['type'] == 'stdio':
             if 'command' not in transport:
-                self.errors.append(f"MCP server {server_index} stdio transport missing command")
-        elif transport['type'] in ['sse', 'websocket']:
+                self._error("MCP server %s stdio transport missing command", server_index)
+        elif transport['type'] in ('sse', 'websocket'):
             if 'url' not in transport:
-                self.errors.append(f"MCP server {server_index} {transport['type']} transport missing url")
+                self._error("MCP server %s %s transport missing url", server_index, transport['type'])
     
     def _validate_mcp_authentication(self, auth: Dict[str, Any], server_index: int) -> None:
         """Validate MCP authentication configuration."""
         if 'type' not in auth:
-            self.errors.append(f"MCP server {server_index} authentication missing required field: type")
+            self._error("MCP server %s authentication missing required field: type", server_index)
             return
         
-        valid_types = ['none', 'api_key', 'oauth', 'custom']
-        if auth['type'] not in valid_types:
-            self.errors.append(f"MCP server {server_index} invalid authentication type: {auth['type']}")
+        if auth['type'] not in _VALID_AUTH_TYPES:
+            self._error("MCP server %s invalid authentication type: %s", server_index, auth['type'])
         
         # Validate authentication-specific fields
         if auth['type'] == 'api_key' and 'api_key' not in auth:
-            self.warnings.append(f"MCP server {server_index} api_key authentication missing api_key field")
+            self._warn("MCP server %s api_key authentication missing api_key field", server_index)
         
         if auth['type'] == 'oauth' and 'token' not in auth:
-            self.warnings.append(f"MCP server {server_index} oauth authentication missing token field")
+            self._warn("MCP server %s oauth authentication missing token field", server_index)
     
     def _validate_evaluation(self, evaluation: Dict[str, Any]) -> None:
         """Validate the evaluation section."""
         if not isinstance(evaluation, dict):
-            self.errors.append("evaluation must be a dictionary")
+            self._error("evaluation must be a dictionary")
             return
         
         if 'metrics' not in evaluation:
-            self.warnings.append("evaluation.metrics is recommended")
+            self._warn("evaluation.metrics is recommended")
     
     def _cross_validate(self, spec: Dict[str, Any]) -> None:
         """Perform cross-validation between sections."""
-        # Validate that referenced models exist
-        if 'tasks' in spec and 'models' in spec:
-            model_ids = {model.get('id') for model in spec['models'] if 'id' in model}
-            
-            for task in spec['tasks']:
-                if 'steps' in task:
-                    for step in task['steps']:
-                        if 'model' in step and step['model'] not in model_ids:
-                            self.errors.append(f"Task references unknown model: {step['model']}")
-        
-        # Validate that referenced prompts exist
-        if 'tasks' in spec and 'prompts' in spec:
-            prompt_ids = {prompt.get('id') for prompt in spec['prompts'] if 'id' in prompt}
-            
-            for task in spec['tasks']:
-                if 'steps' in task:
-                    for step in task['steps']:
-                        if 'prompt' in step and step['prompt'] not in prompt_ids:
-                            self.errors.append(f"Task references unknown prompt: {step['prompt']}")
-        
-        # Validate that referenced MCP servers exist
-        if 'tasks' in spec and 'context' in spec and 'mcp_servers' in spec['context']:
-            mcp_server_ids = {server.get('id') for server in spec['context']['mcp_servers'] if 'id' in server}
-            
-            for task in spec['tasks']:
-                if 'steps' in task:
-                    for step in task['steps']:
-                        if 'mcp_server' in step and step['mcp_server'] not in mcp_server_ids:
-                            self.errors.append(f"Task references unknown MCP server: {step['mcp_server']}")
+        tasks = spec.get('tasks')
+        if not isinstance(tasks, list):
+            return
+
+        # Build every reference id set once. A check is disabled only when
+        # its section is absent or not a list (ids is None; the section
+        # validator reports the bad type): empty prompts/mcp_servers
+        # sections are structurally legal, so an empty set must still flag
+        # every dangling reference.
+        models = spec.get('models')
+        model_ids = ({mid for model in models
+                      if type(model) is dict and (mid := model.get('id')) is not None}
+                     if isinstance(models, list) else None)
+        prompts = spec.get('prompts')
+        prompt_ids = ({pid for prompt in prompts
+                       if type(prompt) is dict and (pid := prompt.get('id')) is not None}
+                      if isinstance(prompts, list) else None)
+
+        context = spec.get('context')
+        servers = context.get('mcp_servers') if isinstance(context, dict) else None
+        mcp_server_ids = ({sid for server in servers
+                           if type(server) is dict and (sid := server.get('id')) is not None}
+                          if isinstance(servers, list) else None)
+
+        if model_ids is None and prompt_ids is None and mcp_server_ids is None:
+            return
+
+        # One pass over the task steps checks all three reference kinds.
+        error = self._error
+        for task in tasks:
+            if type(task) is not dict:
+                continue
+            for step in task.get('steps', ()):
+                if type(step) is not dict:
+                    continue
+                model = step.get('model')
+                if model is not None and model_ids is not None and model not in model_ids:
+                    error("Task references unknown model: %s", model)
+                prompt = step.get('prompt')
+                if prompt is not None and prompt_ids is not None and prompt not in prompt_ids:
+                    error("Task references unknown prompt: %s", prompt)
+                mcp_server = step.get('mcp_server')
+                if mcp_server is not None and mcp_server_ids is not None and mcp_server not in mcp_server_ids:
+                    error("Task references unknown MCP server: %s", mcp_server)
     
+    def _error(self, fmt: str, *args: Any) -> None:
+        """Record a validation error; formatting is deferred to get_errors()."""
+        self.errors.append((fmt, args))
+        if self.fail_fast:
+            raise _AbortValidation
+
+    def _warn(self, fmt: str, *args: Any) -> None:
+        """Record a validation warning; formatting is deferred to get_warnings()."""
+        self.warnings.append((fmt, args))
+
+    @staticmethod
+    def _format_messages(messages: List[Any]) -> List[str]:
+        """Render deferred (template, args) message tuples to strings."""
+        return [fmt % args if args else fmt for fmt, args in messages]
+
     def get_errors(self) -> List[str]:
         """Get list of validation errors."""
-        return self.errors
-    
+        return self._format_messages(self.errors)
+
     def get_warnings(self) -> List[str]:
         """Get list of validation warnings."""
-        return self.warnings
+        return self._format_messages(self.warnings)
     
     def print_results(self) -> None:
         """Print validation results."""
         if self.errors:
             print("❌ Validation Errors:")
-            for error in self.errors:
+            for error in self.get_errors():
                 print(f"  - {error}")
-        
+
         if self.warnings:
             print("⚠️  Validation Warnings:")
-            for warning in self.warnings:
+            for warning in self.get_warnings():
                 print(f"  - {warning}")
         
         if not self.errors and not self.warnings:
@@ -433,9 +941,38 @@ class APAIValidator:
         """Get validation results as dictionary."""
         return {
             'valid': len(self.errors) == 0,
-            'errors': self.errors,
-            'warnings': self.warnings
+            'errors': self.get_errors(),
+            'warnings': self.get_warnings()
         }
+
+    @classmethod
+    def validate_file_static(cls, file_path: str) -> Dict[str, Any]:
+        """Validate a file in one call and return the results dictionary.
+
+        Convenience for fire-and-forget use; the expensive state (YAML C
+        loader, compiled schema) lives at module/class level, so the
+        throwaway instance costs almost nothing.
+        """
+        validator = cls()
+        validator.validate_file(file_path)
+        return validator.get_results()
+
+    @classmethod
+    def validate_paths(cls, paths: List[str]) -> Dict[str, bool]:
+        """Validate many specification files in parallel worker processes.
+
+        Returns a {path: is_valid} mapping. Each worker amortizes its
+        per-process setup (YAML C loader, compiled schema) over many
+        files; per-file messages are discarded, so use validate_file
+        when the error text matters.
+        """
+        if not paths:
+            return {}
+
+        with ProcessPoolExecutor() as executor:
+            futures = [executor.submit(_validate_one, path) for path in paths]
+            results = (future.result() for future in as_completed(futures))
+            return {path: is_valid for path, is_valid, _, _ in results}
     
     # ============================================================================
     # HIERARCHICAL COMPOSITION METHODS
@@ -450,108 +987,186 @@ class APAIValidator:
             
             # Load and merge inherited specifications
             merged_spec = self.merge_inherited_specifications(spec, file_path)
-            
+
+            # Errors recorded while loading/merging (missing or circular
+            # inherits) must survive validate_spec's reset.
+            merge_errors = self.errors
+            merge_warnings = self.warnings
+
             # Validate merged specification
-            return self.validate_spec(merged_spec)
+            is_valid = self.validate_spec(merged_spec)
+
+            if merge_errors:
+                self.errors = merge_errors + self.errors
+                is_valid = False
+            if merge_warnings:
+                self.warnings = merge_warnings + self.warnings
+
+            return is_valid
             
+        except _AbortValidation:
+            return False
         except Exception as e:
-            self.errors.append(f"Unexpected error during hierarchical validation: {e}")
+            self.errors.append(("Unexpected error during hierarchical validation: %s", (e,)))
             return False
     
     def load_spec(self, spec_path: str) -> Optional[Dict[str, Any]]:
-        """Load APAI specification from file."""
+        """Load APAI specification from file.
+
+        Parsed specs are cached per realpath for the lifetime of the
+        validator, so hierarchy walks that reach the same file through
+        several inherit edges parse it only once.
+        """
+        cache_key = os.path.realpath(spec_path)
+        spec = self._spec_cache.get(cache_key)
+        if spec is not None:
+            return spec
+
         try:
-            with open(spec_path, 'r', encoding='utf-8') as f:
-                if spec_path.endswith('.yaml') or spec_path.endswith('.yml'):
-                    return yaml.safe_load(f)
-                elif spec_path.endswith('.json'):
-                    return json.load(f)
-                else:
-                    self.errors.append(f"Unsupported file format: {spec_path}")
-                    return None
+            suffix = spec_path.rsplit('.', 1)[-1].lower()
+            if suffix in _YAML_SUFFIXES:
+                spec = yaml.load(_read_file_bytes(spec_path), Loader=_SafeLoader)
+            elif suffix == 'json':
+                data = _read_file_bytes(spec_path)
+                spec = orjson.loads(data) if orjson is not None else json.loads(data)
+            else:
+                self._error("Unsupported file format: %s", spec_path)
+                return None
+
+            self._spec_cache[cache_key] = spec
+            return spec
         except FileNotFoundError:
-            self.errors.append(f"File not found: {spec_path}")
+            self._error("File not found: %s", spec_path)
             return None
         except yaml.YAMLError as e:
-            self.errors.append(f"YAML parsing error in {spec_path}: {e}")
+            self._error("YAML parsing error in %s: %s", spec_path, e)
             return None
         except json.JSONDecodeError as e:
-            self.errors.append(f"JSON parsing error in {spec_path}: {e}")
+            self._error("JSON parsing error in %s: %s", spec_path, e)
             return None
         except Exception as e:
-            self.errors.append(f"Error loading specification {spec_path}: {e}")
+            self._error("Error loading specification %s: %s", spec_path, e)
             return None
     
+    def clear_caches(self) -> None:
+        """Drop cached parsed specs and merge results.
+
+        Long-lived validator instances should call this when the underlying
+        files may have changed between validations.
+        """
+        self._spec_cache.clear()
+        self.inherited_specs.clear()
+        self.merge_cache.clear()
+
     def resolve_inheritance_path(self, inherit_path: str, current_spec_path: str) -> str:
-        """Resolve inheritance path to absolute path."""
-        current_dir = os.path.dirname(current_spec_path)
-        return os.path.join(current_dir, inherit_path)
+        """Resolve inheritance path relative to the inheriting spec."""
+        return os.path.normpath(os.path.join(os.path.dirname(current_spec_path), inherit_path))
     
     def load_inherited_specs(self, spec: Dict[str, Any], spec_path: str) -> None:
         """Load all inherited specifications."""
         if 'inherits' not in spec or not isinstance(spec['inherits'], list):
             return
-        
+
+        # dirname is the same for every inherit edge of this spec.
+        base_dir = os.path.dirname(spec_path)
         for inherit_path in spec['inherits']:
-            resolved_path = self.resolve_inheritance_path(inherit_path, spec_path)
-            
-            if resolved_path in self.inherited_specs:
+            resolved_path = os.path.normpath(os.path.join(base_dir, inherit_path))
+            key = os.path.realpath(resolved_path)
+
+            if key in self.inherited_specs:
                 continue  # Already loaded
-            
+
             inherited_spec = self.load_spec(resolved_path)
             if inherited_spec is not None:
-                self.inherited_specs[resolved_path] = inherited_spec
-                
+                self.inherited_specs[key] = inherited_spec
+
                 # Recursively load inherited specs
                 self.load_inherited_specs(inherited_spec, resolved_path)
             else:
-                self.errors.append(f"Inherited specification not found: {inherit_path}")
+                self._error("Inherited specification not found: %s", inherit_path)
     
     def deep_merge(self, base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
-        """Deep merge two dictionaries."""
-        result = base.copy()
-        
+        """Deep merge two dictionaries without mutating either input.
+
+        Only the top level and overridden subtrees are copied; subtrees of
+        base that override does not touch are shared by reference in the
+        result. Lists and scalars from override replace the base value
+        wholesale. When either side is empty the other is returned as-is,
+        so the result may alias an input outright — callers must treat it
+        as read-only.
+        """
+        # Sparse overrides are the norm in inheritance chains: most
+        # sections arrive untouched, so skip the copy entirely.
+        if not override:
+            return base
+        if not base:
+            return override
+
+        result = dict(base)
+
         for key, value in override.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = self.deep_merge(result[key], value)
+            base_value = result.get(key)
+            if isinstance(base_value, dict) and isinstance(value, dict):
+                result[key] = self.deep_merge(base_value, value)
             else:
                 result[key] = value
-        
+
         return result
     
-    def merge_inherited_specifications(self, spec: Dict[str, Any], spec_path: str) -> Dict[str, Any]:
-        """Merge specifications based on inheritance."""
-        if spec_path in self.merge_cache:
-            return self.merge_cache[spec_path]
-        
+    def merge_inherited_specifications(self, spec: Dict[str, Any], spec_path: str,
+                                       _in_progress: Optional[set] = None) -> Dict[str, Any]:
+        """Merge specifications based on inheritance.
+
+        Results are cached per realpath, so a file reached through several
+        relative paths (diamond inheritance) is merged only once. Circular
+        inheritance is reported as an error instead of recursing forever.
+        """
+        cache_key = os.path.realpath(spec_path)
+        cached = self.merge_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        if _in_progress is None:
+            _in_progress = set()
+        if cache_key in _in_progress:
+            self._error("Circular inheritance detected at: %s", spec_path)
+            return spec
+        _in_progress.add(cache_key)
+
         # Load inherited specifications
         self.load_inherited_specs(spec, spec_path)
-        
+
         # Start with base specification
         merged = spec.copy()
-        
+
         # Apply inheritance in reverse order (so later specs override earlier ones)
         if 'inherits' in spec and isinstance(spec['inherits'], list):
+            base_dir = os.path.dirname(spec_path)
             for inherit_path in reversed(spec['inherits']):
-                resolved_path = self.resolve_inheritance_path(inherit_path, spec_path)
-                if resolved_path in self.inherited_specs:
-                    inherited_spec = self.inherited_specs[resolved_path]
+                resolved_path = os.path.normpath(os.path.join(base_dir, inherit_path))
+                inherited_spec = self.inherited_specs.get(os.path.realpath(resolved_path))
+                if inherited_spec is not None:
                     # Recursively merge inherited spec
-                    inherited_merged = self.merge_inherited_specifications(inherited_spec, resolved_path)
+                    inherited_merged = self.merge_inherited_specifications(inherited_spec, resolved_path, _in_progress)
                     merged = self.deep_merge(inherited_merged, merged)
-        
+
+        _in_progress.discard(cache_key)
+
         # Cache the result
-        self.merge_cache[spec_path] = merged
+        self.merge_cache[cache_key] = merged
         return merged
     
     def get_hierarchy_info(self, spec: Dict[str, Any]) -> Dict[str, Any]:
         """Get hierarchy information from specification."""
-        hierarchy_info = {}
-        
-        if 'info' in spec and 'ai_metadata' in spec['info'] and 'hierarchy_info' in spec['info']['ai_metadata']:
-            hierarchy_info = spec['info']['ai_metadata']['hierarchy_info']
-        
-        return hierarchy_info
+        info = spec.get('info')
+        if not info:
+            return {}
+
+        metadata = info.get('ai_metadata')
+        if not metadata:
+            return {}
+
+        return metadata.get('hierarchy_info') or {}
     
     def print_hierarchy_tree(self, spec_path: str, level: int = 0) -> None:
         """Print hierarchy tree for a specification."""
@@ -563,8 +1178,9 @@ class APAIValidator:
                 print(f"{indent}❌ Error loading {spec_path}")
                 return
             
-            title = spec.get('info', {}).get('title', 'Unknown')
-            hierarchy_info = self.get_hierarchy_info(spec)
+            info = spec.get('info') or {}
+            title = info.get('title', 'Unknown')
+            hierarchy_info = (info.get('ai_metadata') or {}).get('hierarchy_info') or {}
             level_name = hierarchy_info.get('level', 'unknown')
             scope = hierarchy_info.get('scope', 'unknown')
             
@@ -578,11 +1194,78 @@ class APAIValidator:
         except Exception as e:
             print(f"{indent}❌ Error loading {spec_path}: {e}")
     
+    @staticmethod
+    def _merge_mapping_nodes(base: yaml.MappingNode, override: yaml.MappingNode) -> yaml.MappingNode:
+        """deep_merge, but on composed YAML mapping nodes instead of dicts.
+
+        Same semantics: nested mappings merge recursively, anything else
+        from override replaces the base entry wholesale; override-only
+        keys are appended after the base keys.
+        """
+        merged = {key_node.value: (key_node, value_node)
+                  for key_node, value_node in base.value}
+
+        for key_node, value_node in override.value:
+            existing = merged.get(key_node.value)
+            if (existing is not None
+                    and isinstance(existing[1], yaml.MappingNode)
+                    and isinstance(value_node, yaml.MappingNode)):
+                value_node = APAIValidator._merge_mapping_nodes(existing[1], value_node)
+            merged[key_node.value] = (key_node, value_node)
+
+        return yaml.MappingNode(base.tag, list(merged.values()))
+
+    def merge_specification_files(self, input_paths: List[str], output_path: str) -> bool:
+        """Merge specification files on disk and write the result.
+
+        All-YAML jobs stay at PyYAML's node level: inputs are composed
+        into node trees, merged there, and serialized straight back out,
+        skipping the build-Python-dicts-and-re-represent passes of the
+        normal pipeline. Jobs mixing in JSON (or a YAML document whose
+        root is not a mapping) fall back to load_spec + merge_specifications.
+        """
+        if all(p.rsplit('.', 1)[-1].lower() in _YAML_SUFFIXES
+               for p in [*input_paths, output_path]):
+            try:
+                nodes = []
+                for path in input_paths:
+                    with open(path, 'rb') as f:
+                        nodes.append(yaml.compose(f, Loader=_SafeLoader))
+
+                if all(isinstance(node, yaml.MappingNode) for node in nodes):
+                    if not nodes:
+                        self._error("No specifications to merge")
+                        return False
+                    merged = nodes[0]
+                    for node in nodes[1:]:
+                        merged = self._merge_mapping_nodes(merged, node)
+                    # Flow vs block style travels on the nodes themselves,
+                    # so only the indent needs configuring here.
+                    with open(output_path, 'w', encoding='utf-8') as f:
+                        yaml.serialize(merged, f, Dumper=_SafeDumper, indent=2)
+                    return True
+            except yaml.YAMLError as e:
+                self._error("YAML parsing error: %s", e)
+                return False
+            except Exception as e:
+                self._error("Error merging specifications: %s", e)
+                return False
+
+        specs = []
+        for path in input_paths:
+            spec = self.load_spec(path)
+            if not spec:
+                return False
+            specs.append(spec)
+
+        format_type = 'json' if output_path.endswith('.json') else 'yaml'
+        return self.merge_specifications(specs, output_path, format_type)
+
     def merge_specifications(self, specs: List[Dict[str, Any]], output_path: str, format: str = 'yaml') -> bool:
         """Merge multiple specifications."""
         try:
             if not specs:
-                self.errors.append("No specifications to merge")
+                self._error("No specifications to merge")
                 return False
             
             # Start with first specification
@@ -593,76 +1276,141 @@ class APAIValidator:
                 merged = self.deep_merge(merged, specs[i])
             
             # Save merged specification
-            with open(output_path, 'w', encoding='utf-8') as f:
-                if format == 'yaml':
-                    yaml.dump(merged, f, default_flow_style=False, indent=2)
-                else:
+            if format == 'yaml':
+                with open(output_path, 'w', encoding='utf-8') as f:
+                    yaml.dump(merged, f, Dumper=_SafeDumper, default_flow_style=False, indent=2)
+            elif orjson is not None:
+                # orjson emits UTF-8 bytes directly. OPT_NON_STR_KEYS
+                # matches the stdlib fallback's key coercion — YAML happily
+                # produces int/bool keys (8080:, or the YAML-1.1 on: trap).
+                with open(output_path, 'wb') as f:
+                    f.write(orjson.dumps(
+                        merged,
+                        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            else:
+                with open(output_path, 'w', encoding='utf-8') as f:
                     json.dump(merged, f, indent=2, ensure_ascii=False)
             
             return True
             
         except Exception as e:
-            self.errors.append(f"Error merging specifications: {e}")
+            self._error("Error merging specifications: %s", e)
             return False
 
 
 def main():
     """Main CLI entry point."""
     args = sys.argv[1:]
-    
+
     if len(args) == 0 or args[0] in ['-h', '--help', 'help']:
         show_help()
         sys.exit(0)
-    
+
     command = args[0]
-    options = args[1:]
-    
-    if command == 'validate':
-        handle_validate(options)
-    elif command == 'tree':
-        handle_tree(options)
-    elif command == 'merge':
-        handle_merge(options)
-    else:
+    handler = _COMMANDS.get(command)
+    if handler is None:
         print(f"Unknown command: {command}")
         show_help()
         sys.exit(1)
 
-def handle_validate(options):
-    """Handle validate command."""
-    if len(options) == 0:
-        print("Error: No file specified")
-        print("Usage: python apai_validator.py validate <file> [--hierarchical]")
-        sys.exit(1)
-    
-    file_path = options[0]
-    hierarchical = '--hierarchical' in options
-    
-    print(f"Validating APAI specification{' with inheritance' if hierarchical else ''}: {file_path}")
-    print('-' * 60)
-    
+    handler(args[1:])
+
+def _validate_one(file_path, hierarchical=False):
+    """Validate a single specification file (runs in a worker process)."""
     validator = APAIValidator()
-    
+
     if hierarchical:
         is_valid = validator.validate_with_inheritance(file_path)
     else:
         is_valid = validator.validate_file(file_path)
-    
-    if is_valid:
-        print("✅ Validation successful!")
-    else:
-        print("❌ Validation failed!")
-        print("\nErrors:")
-        for error in validator.get_errors():
+
+    return file_path, is_valid, validator.get_errors(), validator.get_warnings()
+
+def handle_validate(options):
+    """Handle validate command."""
+    hierarchical = '--hierarchical' in options
+    files = [option for option in options if not option.startswith('--')]
+
+    if len(files) == 0:
+        print("Error: No file specified")
+        print("Usage: python apai_validator.py validate <file> [file2 ...] [--hierarchical]")
+        sys.exit(1)
+
+    if len(files) == 1:
+        file_path = files[0]
+
+        print(f"Validating APAI specification{' with inheritance' if hierarchical else ''}: {file_path}")
+        print('-' * 60)
+
+        file_path, is_valid, errors, warnings = _validate_one(file_path, hierarchical)
+
+        if is_valid:
+            print("✅ Validation successful!")
+        else:
+            print("❌ Validation failed!")
+            print("\nErrors:")
+            for error in errors:
+                print(f"  • {error}")
+
+        if warnings:
+            print("\nWarnings:")
+            for warning in warnings:
+                print(f"  ⚠️  {warning}")
+
+        sys.exit(0 if is_valid else 1)
+
+    # Several files: fan the work out across CPU cores so YAML parsing and
+    # validation run in parallel, one file per worker task.
+    print(f"Validating {len(files)} APAI specifications{' with inheritance' if hierarchical else ''}")
+    print('-' * 60)
+
+    with ProcessPoolExecutor() as executor:
+        results = list(executor.map(_validate_one, files, [hierarchical] * len(files)))
+
+    failed = 0
+    for file_path, is_valid, errors, warnings in results:
+        print(f"{'✅' if is_valid else '❌'} {file_path}")
+        for error in errors:
             print(f"  • {error}")
-    
-    warnings = validator.get_warnings()
-    if warnings:
-        print("\nWarnings:")
         for warning in warnings:
             print(f"  ⚠️  {warning}")
-    
-    sys.exit(0 if is_valid else 1)
+        if not is_valid:
+            failed += 1
+
+    print('-' * 60)
+    print(f"{len(results) - failed}/{len(results)} specifications valid")
+
+    sys.exit(0 if failed == 0 else 1)
+
+def handle_batch(options):
+    """Handle batch command."""
+    hierarchical = '--hierarchical' in options
+    files = [option for option in options if not option.startswith('--')]
+
+    if len(files) == 0:
+        print("Error: No files specified")
+        print("Usage: python apai_validator.py batch <file1> [file2] ... [--hierarchical]")
+        sys.exit(1)
+
+    # Unlike validate, results are printed as workers finish, so long runs
+    # show progress instead of a silent pause followed by all the output.
+    failed = 0
+    with ProcessPoolExecutor() as executor:
+        futures = [executor.submit(_validate_one, f, hierarchical) for f in files]
+        for future in as_completed(futures):
+            file_path, is_valid, errors, warnings = future.result()
+            print(f"{'✅' if is_valid else '❌'} {file_path}")
+            for error in errors:
+                print(f"  • {error}")
+            for warning in warnings:
+                print(f"  ⚠️  {warning}")
+            if not is_valid:
+                failed += 1
+
+    print('-' * 60)
+    print(f"{len(files) - failed}/{len(files)} specifications valid")
+
+    sys.exit(0 if failed == 0 else 1)
 
 def handle_tree(options):
     """Handle tree command."""
@@ -694,28 +1442,14 @@ def handle_merge(options):
     print(f"Input files: {', '.join(input_files)}")
     print('-' * 60)
     
-    validator = APAIValidator()
-    specs = []
-    
     for file in input_files:
         if not os.path.exists(file):
             print(f"Error: File not found: {file}")
             sys.exit(1)
-        
-        spec = validator.load_spec(file)
-        if not spec:
-            print(f"Error: Cannot load specification: {file}")
-            sys.exit(1)
-        
-        specs.append(spec)
-        print(f"✅ Loaded: {file}")
-    
-    format_type = 'yaml'
-    if output_path.endswith('.json'):
-        format_type = 'json'
-    
-    success = validator.merge_specifications(specs, output_path, format_type)
-    
+
+    validator = APAIValidator()
+    success = validator.merge_specification_files(input_files, output_path)
+
     if success:
         print("\n✅ Merge completed successfully!")
         print(f"Merged specification saved to: {output_path}")
@@ -736,7 +1470,8 @@ def show_help():
     print("")
     
     print("COMMANDS:")
-    print("  validate <file> [--hierarchical]  Validate APAI specification")
+    print("  validate <files...> [--hierarchical]  Validate APAI specifications (parallel for multiple files)")
+    print("  batch <files...> [--hierarchical]  Validate many specifications, reporting results as they finish")
     print("  tree <file>                       Show hierarchy tree for specification")
     print("  merge <output> <files...>         Merge multiple specifications")
     print("")
@@ -756,5 +1491,14 @@ def show_help():
     print("For more information, visit: https://github.com/FabioGuin/APAI")
 
 
+# Command dispatch table for main(); defined after the handlers it names.
+_COMMANDS = {
+    'validate': handle_validate,
+    'batch': handle_batch,
+    'tree': handle_tree,
+    'merge': handle_merge,
+}
+
+
 if __name__ == '__main__':
     main()
@@ -0,0 +1,108 @@
+"""Parity tests for the APAI validator's validation engines.
+
+The validator has two structural-validation paths: the hand-written
+per-section checks, and a fastjsonschema validator compiled from a schema
+generated off the same tables. These tests pin down that both paths agree
+on every shipped example, so installing the optional performance
+dependency can never flip a verdict.
+"""
+
+import glob
+import json
+import os
+
+import pytest
+
+import apai_validator
+from apai_validator import APAIValidator
+
+_EXAMPLES_DIR = os.path.join(os.path.dirname(__file__), '..', '..', 'examples')
+EXAMPLE_FILES = sorted(
+    glob.glob(os.path.join(_EXAMPLES_DIR, '**', '*.yaml'), recursive=True)
+    + glob.glob(os.path.join(_EXAMPLES_DIR, '**', '*.json'), recursive=True)
+)
+
+# Invalid specs exercising each error family; both engines must reject all.
+INVALID_SPECS = [
+    {'models': None},
+    {'models': []},
+    {'apai': 1},
+    {'info': {'title': 'x', 'version': '1'}},
+    {'models': [{'id': 'm', 'type': 'LLM', 'provider': 'p', 'name': 'n'}]},
+    {'prompts': [{'id': 'p', 'role': 'wizard', 'template': 't'}]},
+    {'constraints': [{'id': 'c', 'rule': 'r', 'severity': 'fatal'}]},
+    {'tasks': [{'id': 't', 'description': 'd', 'steps': [{'name': 's', 'action': 'mcp_tool'}]}]},
+    {'context': {'mcp_servers': [{'id': 's'}]}},
+    {'evaluation': []},
+]
+
+
+def _fallback_validator():
+    """A validator forced onto the hand-written path.
+
+    _compiled_schema lives on the class (instances have __slots__); the
+    autouse fixture below resets it after every test.
+    """
+    APAIValidator._compiled_schema = False
+    return APAIValidator()
+
+
+def _spec_for(path):
+    spec = APAIValidator().load_spec(path)
+    assert spec is not None, f"could not load {path}"
+    return spec
+
+
+@pytest.fixture(autouse=True)
+def _reset_compiled_schema():
+    """Recompile per test so engine-forcing tests cannot leak state."""
+    yield
+    APAIValidator._compiled_schema = None
+
+
+@pytest.mark.parametrize('path', EXAMPLE_FILES, ids=os.path.basename)
+def test_examples_valid_without_schema_engine(path):
+    spec = _spec_for(path)
+    validator = _fallback_validator()
+    assert validator.validate_spec(spec), validator.get_errors()
+
+
+@pytest.mark.skipif(apai_validator.fastjsonschema is None,
+                    reason='fastjsonschema not installed')
+@pytest.mark.parametrize('path', EXAMPLE_FILES, ids=os.path.basename)
+def test_examples_valid_with_schema_engine(path):
+    spec = _spec_for(path)
+    validator = APAIValidator()
+    assert validator._get_compiled_schema() is not None
+    assert validator.validate_spec(spec), validator.get_errors()
+
+
+@pytest.mark.skipif(apai_validator.fastjsonschema is None,
+                    reason='fastjsonschema not installed')
+@pytest.mark.parametrize('spec', INVALID_SPECS)
+def test_engines_agree_on_invalid_specs(spec):
+    compiled = APAIValidator()
+    assert compiled._get_compiled_schema() is not None
+    assert compiled.validate_spec(spec) is False, spec
+
+    fallback = _fallback_validator()
+    assert fallback.validate_spec(spec) is False, spec
+
+
+@pytest.mark.skipif(apai_validator.ijson is None, reason='ijson not installed')
+@pytest.mark.parametrize('spec', INVALID_SPECS)
+def test_streaming_verdict_matches_in_memory(tmp_path, spec):
+    path = tmp_path / 'spec.json'
+    path.write_text(json.dumps(spec))
+
+    streaming_ok = APAIValidator().validate_file_streaming(str(path))
+    assert streaming_ok == APAIValidator().validate_spec(spec)
+
+
+@pytest.mark.skipif(apai_validator.ijson is None, reason='ijson not installed')
+@pytest.mark.parametrize('path',
+                         [p for p in EXAMPLE_FILES if p.endswith('.json')],
+                         ids=os.path.basename)
+def test_streaming_verdict_matches_on_examples(path):
+    streaming_ok = APAIValidator().validate_file_streaming(path)
+    assert streaming_ok == APAIValidator().validate_spec(_spec_for(path))